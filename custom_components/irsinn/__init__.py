@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
-import aiofiles
-import aiohttp
-import binascii
-from distutils.version import StrictVersion
-import json
+import asyncio
+from functools import partial
+from itertools import takewhile
 import logging
 import os.path
+from pathlib import Path
 import struct
-from typing import Any
+from typing import Any, Iterable
 
 import voluptuous as vol
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from homeassistant.const import __version__ as current_ha_version
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
@@ -32,6 +38,24 @@ REMOTE_BASE_URL = (
     "custom_components/irsinn/")
 COMPONENT_ABS_DIR = os.path.dirname(
     os.path.abspath(__file__))
+# Maximum number of files downloaded in parallel by the updater.
+UPDATE_CONCURRENCY = 8
+# Size of the chunks written to disk while downloading.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _version_tuple(version: str) -> tuple[int, ...]:
+    """Return the numeric ``major.minor.patch`` part of ``version``."""
+    parts = (version.split(".") + ["0", "0"])[:3]
+    return tuple(int("".join(takewhile(str.isdigit, part)) or 0) for part in parts)
+
+
+_CURRENT_VERSION = _version_tuple(VERSION)
+_CURRENT_HA_VERSION = _version_tuple(current_ha_version)
+
+# Parsed device files keyed by ``(domain, device_code)``. Each entry is the
+# task loading the file so concurrent callers share a single load.
+_DEVICE_CONFIG_CACHE: dict[tuple[str, int], asyncio.Future] = {}
 
 CONF_CHECK_UPDATES = 'check_updates'
 CONF_UPDATE_BRANCH = 'update_branch'
@@ -76,17 +100,41 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
-async def async_get_device_config(domain: str, device_code: int) -> dict[str, Any]:
-    """Load the device configuration for the given domain and code."""
-    device_files_subdir = os.path.join("codes", domain)
-    device_files_absdir = os.path.join(COMPONENT_ABS_DIR, device_files_subdir)
-    os.makedirs(device_files_absdir, exist_ok=True)
+async def async_get_device_config(
+    hass: HomeAssistant, domain: str, device_code: int
+) -> dict[str, Any]:
+    """Load the device configuration for the given domain and code.
+
+    Device files do not change at runtime, so each one is read and parsed
+    only once. The returned dict is shared between callers and must not be
+    mutated.
+    """
+    key = (domain, device_code)
+    task = _DEVICE_CONFIG_CACHE.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _async_load_device_config(hass, domain, device_code)
+        )
+        _DEVICE_CONFIG_CACHE[key] = task
+
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        if _DEVICE_CONFIG_CACHE.get(key) is task:
+            del _DEVICE_CONFIG_CACHE[key]
+        raise
+
 
-    device_json_path = os.path.join(
-        device_files_absdir, f"{device_code}.json"
-    )
+async def _async_load_device_config(
+    hass: HomeAssistant, domain: str, device_code: int
+) -> dict[str, Any]:
+    """Read and parse the device file, downloading it if missing."""
+    device_files_absdir = Path(COMPONENT_ABS_DIR, "codes", domain)
+    device_json_path = device_files_absdir / f"{device_code}.json"
 
-    if not os.path.exists(device_json_path):
+    try:
+        data = await hass.async_add_executor_job(device_json_path.read_bytes)
+    except FileNotFoundError:
         _LOGGER.warning(
             "Couldn't find the device Json file. The component will try to download it from the GitHub repo."
         )
@@ -96,16 +144,25 @@ async def async_get_device_config(domain: str, device_code: int) -> dict[str, An
             f"codes/{domain}/{device_code}.json"
         )
         try:
-            await Helper.downloader(codes_source, device_json_path)
+            await hass.async_add_executor_job(
+                partial(device_files_absdir.mkdir, parents=True, exist_ok=True)
+            )
+            await Helper.downloader(hass, codes_source, str(device_json_path))
         except Exception as exc:
             _LOGGER.error(
                 "There was an error while downloading the device Json file.",
                 exc_info=exc,
             )
             raise
+        data = await hass.async_add_executor_job(device_json_path.read_bytes)
+
+    return json_loads(data)
+
 
-    async with aiofiles.open(device_json_path, mode="r") as file:
-        return json.loads(await file.read())
+def _make_dirs(paths: Iterable[str]) -> None:
+    """Create each directory in ``paths`` if it does not exist yet."""
+    for path in paths:
+        os.makedirs(path, exist_ok=True)
 
 
 async def _update(
@@ -116,70 +173,80 @@ async def _update(
 ) -> None:
     """Check for and optionally perform component updates."""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(MANIFEST_URL.format(branch)) as response:
-                if response.status != 200:
-                    return
-
-                data = await response.json(content_type="text/plain")
-                min_ha_version = data["homeassistant"]
-                last_version = data["updater"]["version"]
-                release_notes = data["updater"]["releaseNotes"]
-
-                if StrictVersion(last_version) <= StrictVersion(VERSION):
-                    if notify_if_latest:
-                        hass.components.persistent_notification.async_create(
-                            "You're already using the latest version!", title="IRsinn"
-                        )
-                    return
-
-                if StrictVersion(current_ha_version) < StrictVersion(min_ha_version):
-                    hass.components.persistent_notification.async_create(
-                        "There is a new version of IRsinn integration, but it is **incompatible** "
-                        "with your system. Please first update Home Assistant.",
-                        title="IRsinn",
-                    )
-                    return
-
-                if not do_update:
+        session = async_get_clientsession(hass)
+        async with session.get(MANIFEST_URL.format(branch)) as response:
+            if response.status != 200:
+                return
+
+            data = json_loads(await response.read())
+            min_ha_version = data["homeassistant"]
+            last_version = data["updater"]["version"]
+            release_notes = data["updater"]["releaseNotes"]
+
+            if _version_tuple(last_version) <= _CURRENT_VERSION:
+                if notify_if_latest:
                     hass.components.persistent_notification.async_create(
-                        "A new version of IRsinn integration is available ({}). "
-                        "Call the ``irsinn.update_component`` service to update "
-                        "the integration. \n\n **Release notes:** \n{}".format(
-                            last_version, release_notes
-                        ),
-                        title="IRsinn",
+                        "You're already using the latest version!", title="IRsinn"
                     )
-                    return
+                return
+
+            if _CURRENT_HA_VERSION < _version_tuple(min_ha_version):
+                hass.components.persistent_notification.async_create(
+                    "There is a new version of IRsinn integration, but it is **incompatible** "
+                    "with your system. Please first update Home Assistant.",
+                    title="IRsinn",
+                )
+                return
+
+            if not do_update:
+                hass.components.persistent_notification.async_create(
+                    "A new version of IRsinn integration is available ({}). "
+                    "Call the ``irsinn.update_component`` service to update "
+                    "the integration. \n\n **Release notes:** \n{}".format(
+                        last_version, release_notes
+                    ),
+                    title="IRsinn",
+                )
+                return
+
+            files = data["updater"]["files"]
+            base_url = REMOTE_BASE_URL.format(branch)
+            targets = {
+                file: os.path.join(COMPONENT_ABS_DIR, file) for file in files
+            }
+            await hass.async_add_executor_job(
+                _make_dirs, {os.path.dirname(dest) for dest in targets.values()}
+            )
 
-                files = data["updater"]["files"]
-                has_errors = False
+            semaphore = asyncio.BoundedSemaphore(UPDATE_CONCURRENCY)
 
-                for file in files:
+            async def _download(file: str) -> bool:
+                async with semaphore:
                     try:
-                        source = REMOTE_BASE_URL.format(branch) + file
-                        dest = os.path.join(COMPONENT_ABS_DIR, file)
-                        os.makedirs(os.path.dirname(dest), exist_ok=True)
-                        await Helper.downloader(source, dest)
+                        await Helper.downloader(hass, base_url + file, targets[file])
                     except Exception:
-                        has_errors = True
                         _LOGGER.error(
                             "Error updating %s. Please update the file manually.", file
                         )
-
-                if has_errors:
-                    hass.components.persistent_notification.async_create(
-                        "There was an error updating one or more files of IRsinn. "
-                        "Please check the logs for more information.",
-                        title="IRsinn",
-                    )
-                else:
-                    hass.components.persistent_notification.async_create(
-                        "Successfully updated to {}. Please restart Home Assistant.".format(
-                            last_version
-                        ),
-                        title="IRsinn",
-                    )
+                        return False
+                    return True
+
+            results = await asyncio.gather(*(_download(file) for file in files))
+            has_errors = not all(results)
+
+            if has_errors:
+                hass.components.persistent_notification.async_create(
+                    "There was an error updating one or more files of IRsinn. "
+                    "Please check the logs for more information.",
+                    title="IRsinn",
+                )
+            else:
+                hass.components.persistent_notification.async_create(
+                    "Successfully updated to {}. Please restart Home Assistant.".format(
+                        last_version
+                    ),
+                    title="IRsinn",
+                )
     except Exception:
         _LOGGER.error("An error occurred while checking for updates.")
 
@@ -187,47 +254,57 @@ class Helper:
     """Collection of helper methods for IR code manipulation."""
 
     @staticmethod
-    async def downloader(source: str, dest: str) -> None:
+    async def downloader(hass: HomeAssistant, source: str, dest: str) -> None:
         """Download a file from ``source`` to ``dest`` asynchronously."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(source) as response:
-                if response.status != 200:
-                    raise FileNotFoundError(source)
-                async with aiofiles.open(dest, mode="wb") as file:
-                    await file.write(await response.read())
+        session = async_get_clientsession(hass)
+        async with session.get(source) as response:
+            if response.status != 200:
+                raise FileNotFoundError(source)
+
+            file = await hass.async_add_executor_job(open, dest, "wb")
+            try:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    await hass.async_add_executor_job(file.write, chunk)
+            finally:
+                await hass.async_add_executor_job(file.close)
 
     @staticmethod
     def pronto2lirc(pronto: bytes) -> list[int]:
         """Convert a Pronto code to a list of LIRC pulse widths."""
-        codes = [int(binascii.hexlify(pronto[i : i + 2]), 16) for i in range(0, len(pronto), 2)]
+        if len(pronto) < 8:
+            raise ValueError("Pronto code is too short")
 
-        if codes[0]:
+        zero, carrier, once_pairs, repeat_pairs = struct.unpack_from(">4H", pronto)
+        if zero:
             raise ValueError("Pronto code should start with 0000")
-        if len(codes) != 4 + 2 * (codes[2] + codes[3]):
+        if not carrier:
+            raise ValueError("Pronto code has no carrier frequency")
+        count = 2 * (once_pairs + repeat_pairs)
+        if len(pronto) != 8 + 2 * count:
             raise ValueError("Number of pulse widths does not match the preamble")
 
-        frequency = 1 / (codes[1] * 0.241246)
-        return [int(round(code / frequency)) for code in codes[4:]]
+        frequency = 1 / (carrier * 0.241246)
+        return [
+            round(code / frequency)
+            for code in struct.unpack_from(f">{count}H", pronto, 8)
+        ]
 
     @staticmethod
     def lirc2broadlink(pulses: list[int]) -> bytearray:
         """Convert LIRC pulses to Broadlink packet format."""
-        array = bytearray()
-        for pulse in pulses:
-            pulse = int(pulse * 269 / 8192)
-            if pulse < 256:
-                array += bytearray(struct.pack(">B", pulse))
-            else:
-                array += bytearray([0x00])
-                array += bytearray(struct.pack(">H", pulse))
-
-        packet = bytearray([0x26, 0x00])
-        packet += bytearray(struct.pack("<H", len(array)))
-        packet += array
-        packet += bytearray([0x0D, 0x05])
+        pulses = [pulse * 269 >> 13 for pulse in pulses]
+        # Long pulses are written as a zero byte followed by a 16-bit value.
+        array = struct.pack(
+            ">" + "".join("B" if pulse < 256 else "xH" for pulse in pulses),
+            *pulses,
+        )
 
+        size = len(array)
+        end = 4 + size + 2
         # Pad packet size to multiple of 16 bytes for 128-bit AES encryption.
-        remainder = (len(packet) + 4) % 16
-        if remainder:
-            packet += bytearray(16 - remainder)
+        # The padding is already zeroed by the allocation.
+        packet = bytearray(end + (-(end + 4)) % 16)
+        struct.pack_into("<BBH", packet, 0, 0x26, 0x00, size)
+        packet[4 : 4 + size] = array
+        packet[4 + size : end] = b"\x0D\x05"
         return packet
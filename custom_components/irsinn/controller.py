@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from base64 import b64encode
-import binascii
-import json
+from functools import lru_cache
 import logging
-from typing import Any, Iterable, List
+import re
+import struct
+from types import MappingProxyType
+from typing import AbstractSet, Any, Callable, List, Mapping
 
-import requests
+import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from . import Helper
+from . import Helper, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,12 +34,20 @@ ENC_HEX = "Hex"
 ENC_PRONTO = "Pronto"
 ENC_RAW = "Raw"
 
-BROADLINK_COMMANDS_ENCODING = (ENC_BASE64, ENC_HEX, ENC_PRONTO)
-XIAOMI_COMMANDS_ENCODING = (ENC_PRONTO, ENC_RAW)
-MQTT_COMMANDS_ENCODING = (ENC_RAW,)
-LOOKIN_COMMANDS_ENCODING = (ENC_PRONTO, ENC_RAW)
-ESPHOME_COMMANDS_ENCODING = (ENC_RAW,)
-ZHA_COMMANDS_ENCODING = (ENC_BASE64, ENC_RAW)
+BROADLINK_COMMANDS_ENCODING = frozenset({ENC_BASE64, ENC_HEX, ENC_PRONTO})
+XIAOMI_COMMANDS_ENCODING = frozenset({ENC_PRONTO, ENC_RAW})
+MQTT_COMMANDS_ENCODING = frozenset({ENC_RAW})
+LOOKIN_COMMANDS_ENCODING = frozenset({ENC_PRONTO, ENC_RAW})
+ESPHOME_COMMANDS_ENCODING = frozenset({ENC_RAW})
+ZHA_COMMANDS_ENCODING = frozenset({ENC_BASE64, ENC_RAW})
+
+ZHA_CLUSTER_ID = 57348
+ZHA_COMMAND_ID = 2
+
+LOOKIN_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Hex digits, optionally separated by whitespace as bytearray.fromhex allows.
+_PRONTO_RE = re.compile(r"[0-9A-Fa-f\s]+")
 
 
 def get_controller(
@@ -50,27 +62,70 @@ def get_controller(
     Raises:
         ValueError: If the controller type is not supported.
     """
-    controllers = {
-        BROADLINK_CONTROLLER: BroadlinkController,
-        XIAOMI_CONTROLLER: XiaomiController,
-        MQTT_CONTROLLER: MQTTController,
-        LOOKIN_CONTROLLER: LookinController,
-        ESPHOME_CONTROLLER: ESPHomeController,
-        ZHA_CONTROLLER: ZHAController,
-    }
-
     try:
-        cls = controllers[controller]
+        cls = _CONTROLLERS[controller]
     except KeyError as exc:
         raise ValueError("The controller is not supported.") from exc
 
     return cls(hass, controller, encoding, controller_data, delay)
 
 
+def _convert_hex(item: str) -> str:
+    """Convert a Hex command to Base64."""
+    try:
+        raw = bytes.fromhex(item)
+    except ValueError as exc:
+        raise ValueError("Error while converting Hex to Base64 encoding") from exc
+    return b64encode(raw).decode("ascii")
+
+
+def _convert_pronto(item: str) -> str:
+    """Convert a Pronto command to Broadlink Base64."""
+    try:
+        if not _PRONTO_RE.fullmatch(item):
+            raise ValueError("Pronto code contains non-hex characters")
+        pronto_bytes = bytearray.fromhex(item)
+        pronto_bytes = Helper.pronto2lirc(pronto_bytes)
+        pronto_bytes = Helper.lirc2broadlink(pronto_bytes)
+    except (ValueError, struct.error) as exc:
+        raise ValueError("Error while converting Pronto to Base64 encoding") from exc
+    return b64encode(pronto_bytes).decode("ascii")
+
+
+# Base64 commands are sent as they are and have no converter.
+_BROADLINK_CONVERTERS: Mapping[str, Callable[[str], str]] = MappingProxyType(
+    {ENC_HEX: _convert_hex, ENC_PRONTO: _convert_pronto}
+)
+
+
+def encode_broadlink_command(
+    encoding: str, command: str | List[str]
+) -> str | List[str]:
+    """Convert a Hex or Pronto command to Broadlink Base64.
+
+    Raises:
+        ValueError: If the command cannot be converted.
+    """
+    convert = _BROADLINK_CONVERTERS.get(encoding)
+    if convert is None:
+        return command
+    if isinstance(command, list):
+        return [convert(item) for item in command]
+    return convert(command)
+
+
+@lru_cache(maxsize=128)
+def _parse_esphome_command(command: str) -> Any:
+    """Parse an ESPHome command, reusing earlier results."""
+    return json_loads(command)
+
+
 class AbstractController(ABC):
     """Base representation of a controller device."""
 
-    supported_encodings: Iterable[str] = ()
+    __slots__ = ("hass", "_controller", "_encoding", "_controller_data", "_delay")
+
+    supported_encodings: AbstractSet[str] = frozenset()
 
     def __init__(
         self,
@@ -99,47 +154,58 @@ class AbstractController(ABC):
         """Send a command."""
         raise NotImplementedError
 
+    async def send_many(self, commands: List[Any]) -> None:
+        """Send several commands, waiting the configured delay between them."""
+        delay = self._delay
+        for index, command in enumerate(commands):
+            if index and delay > 0:
+                await asyncio.sleep(delay)
+            await self.send(command)
+
 
 class BroadlinkController(AbstractController):
     """Controls a Broadlink device."""
 
+    __slots__ = ("_convert", "_service_template")
+
     supported_encodings = BROADLINK_COMMANDS_ENCODING
 
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        controller: str,
+        encoding: str,
+        controller_data: str,
+        delay: float,
+    ) -> None:
+        super().__init__(hass, controller, encoding, controller_data, delay)
+        self._convert = _BROADLINK_CONVERTERS.get(encoding)
+        self._service_template = {
+            ATTR_ENTITY_ID: controller_data,
+            "delay_secs": delay,
+        }
+
     async def send(self, command: str | List[str]) -> None:
         """Send a command."""
-        commands: List[str] = []
-
-        if not isinstance(command, list):
-            command = [command]
-
-        for item in command:
-            if self._encoding == ENC_HEX:
-                try:
-                    raw = binascii.unhexlify(item)
-                except binascii.Error as exc:
-                    raise ValueError(
-                        "Error while converting Hex to Base64 encoding"
-                    ) from exc
-                item = b64encode(raw).decode("utf-8")
-            elif self._encoding == ENC_PRONTO:
-                try:
-                    pronto = item.replace(" ", "")
-                    pronto_bytes = bytearray.fromhex(pronto)
-                    pronto_bytes = Helper.pronto2lirc(pronto_bytes)
-                    pronto_bytes = Helper.lirc2broadlink(pronto_bytes)
-                except (binascii.Error, ValueError) as exc:
-                    raise ValueError(
-                        "Error while converting Pronto to Base64 encoding"
-                    ) from exc
-                item = b64encode(pronto_bytes).decode("utf-8")
-
-            commands.append("b64:" + item)
-
-        service_data = {
-            ATTR_ENTITY_ID: self._controller_data,
-            "command": commands,
-            "delay_secs": self._delay,
-        }
+        await self.send_many([command])
+
+    async def send_many(self, commands: List[str | List[str]]) -> None:
+        """Send several commands in a single service call.
+
+        Broadlink applies the configured delay between them itself.
+        """
+        items = [
+            item
+            for command in commands
+            for item in (command if isinstance(command, list) else (command,))
+        ]
+        convert = self._convert
+        if convert is None:
+            commands = ["b64:" + item for item in items]
+        else:
+            commands = ["b64:" + convert(item) for item in items]
+
+        service_data = {**self._service_template, "command": commands}
 
         await self.hass.services.async_call(
             "remote", "send_command", service_data
@@ -149,13 +215,26 @@ class BroadlinkController(AbstractController):
 class XiaomiController(AbstractController):
     """Controls a Xiaomi device."""
 
+    __slots__ = ("_command_prefix",)
+
     supported_encodings = XIAOMI_COMMANDS_ENCODING
 
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        controller: str,
+        encoding: str,
+        controller_data: str,
+        delay: float,
+    ) -> None:
+        super().__init__(hass, controller, encoding, controller_data, delay)
+        self._command_prefix = f"{encoding.lower()}:"
+
     async def send(self, command: str) -> None:
         """Send a command."""
         service_data = {
             ATTR_ENTITY_ID: self._controller_data,
-            "command": f"{self._encoding.lower()}:{command}",
+            "command": self._command_prefix + command,
         }
 
         await self.hass.services.async_call(
@@ -166,20 +245,32 @@ class XiaomiController(AbstractController):
 class ZHAController(AbstractController):
     """Controls a ZHA device."""
 
+    __slots__ = ("_service_template",)
+
     supported_encodings = ZHA_COMMANDS_ENCODING
 
-    async def send(self, command: str) -> None:
-        """Send a command."""
-        service_data = {
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        controller: str,
+        encoding: str,
+        controller_data: str,
+        delay: float,
+    ) -> None:
+        super().__init__(hass, controller, encoding, controller_data, delay)
+        self._service_template = {
             "cluster_type": "in",
             "endpoint_id": 1,
-            "command": 2,
-            "ieee": self._controller_data,
+            "command": ZHA_COMMAND_ID,
+            "ieee": controller_data,
             "command_type": "server",
-            "params": {"code": command},
-            "cluster_id": 57348,
+            "cluster_id": ZHA_CLUSTER_ID,
         }
 
+    async def send(self, command: str) -> None:
+        """Send a command."""
+        service_data = {**self._service_template, "params": {"code": command}}
+
         await self.hass.services.async_call(
             "zha", "issue_zigbee_cluster_command", service_data
         )
@@ -188,6 +279,8 @@ class ZHAController(AbstractController):
 class MQTTController(AbstractController):
     """Controls a MQTT device."""
 
+    __slots__ = ()
+
     supported_encodings = MQTT_COMMANDS_ENCODING
 
     async def send(self, command: str) -> None:
@@ -202,27 +295,53 @@ class MQTTController(AbstractController):
 class LookinController(AbstractController):
     """Controls a Lookin device."""
 
+    __slots__ = ("_url_prefix",)
+
     supported_encodings = LOOKIN_COMMANDS_ENCODING
 
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        controller: str,
+        encoding: str,
+        controller_data: str,
+        delay: float,
+    ) -> None:
+        super().__init__(hass, controller, encoding, controller_data, delay)
+        url_encoding = encoding.lower().replace("pronto", "prontohex")
+        self._url_prefix = f"http://{controller_data}/commands/ir/{url_encoding}/"
+
     async def send(self, command: str) -> None:
         """Send a command."""
-        encoding = self._encoding.lower().replace("pronto", "prontohex")
-        url = (
-            f"http://{self._controller_data}/commands/ir/"
-            f"{encoding}/{command}"
-        )
-        await self.hass.async_add_executor_job(requests.get, url)
+        url = self._url_prefix + command
+        session = async_get_clientsession(self.hass)
+        async with session.get(url, timeout=LOOKIN_TIMEOUT) as response:
+            response.raise_for_status()
 
 
 class ESPHomeController(AbstractController):
     """Controls an ESPHome device."""
 
+    __slots__ = ()
+
     supported_encodings = ESPHOME_COMMANDS_ENCODING
 
     async def send(self, command: str) -> None:
         """Send a command."""
-        service_data = {"command": json.loads(command)}
+        service_data = {"command": _parse_esphome_command(command)}
 
         await self.hass.services.async_call(
             "esphome", self._controller_data, service_data
         )
+
+
+_CONTROLLERS: Mapping[str, type[AbstractController]] = MappingProxyType(
+    {
+        BROADLINK_CONTROLLER: BroadlinkController,
+        XIAOMI_CONTROLLER: XiaomiController,
+        MQTT_CONTROLLER: MQTTController,
+        LOOKIN_CONTROLLER: LookinController,
+        ESPHOME_CONTROLLER: ESPHomeController,
+        ZHA_CONTROLLER: ZHAController,
+    }
+)
@@ -66,7 +66,7 @@ async def async_setup_platform(
     device_code = config.get(CONF_DEVICE_CODE)
 
     try:
-        device_data = await async_get_device_config("light", device_code)
+        device_data = await async_get_device_config(hass, "light", device_code)
     except Exception:
         _LOGGER.error("The device JSON file is invalid")
         return
@@ -50,7 +50,7 @@ async def async_setup_platform(
     device_code = config.get(CONF_DEVICE_CODE)
 
     try:
-        device_data = await async_get_device_config("media_player", device_code)
+        device_data = await async_get_device_config(hass, "media_player", device_code)
     except Exception:
         _LOGGER.error("The device JSON file is invalid")
         return
@@ -103,6 +103,9 @@ class IRsinnMediaPlayer(MediaPlayerEntity, RestoreEntity):
         if 'sources' in self._commands and self._commands['sources'] is not None:
             self._support_flags = self._support_flags | MediaPlayerEntityFeature.SELECT_SOURCE | MediaPlayerEntityFeature.PLAY_MEDIA
 
+            #Renaming must not touch the shared device data
+            self._commands = {**self._commands, 'sources': dict(self._commands['sources'])}
+
             for source, new_name in config.get(CONF_SOURCE_NAMES, {}).items():
                 if source in self._commands['sources']:
                     if new_name is not None:
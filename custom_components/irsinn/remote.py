@@ -1,10 +1,9 @@
-import asyncio
 import logging
 
 import voluptuous as vol
 
 from homeassistant.components.remote import RemoteEntity, PLATFORM_SCHEMA, RemoteEntityFeature
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, STATE_OFF, STATE_ON
 import homeassistant.helpers.config_validation as cv
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -12,7 +11,14 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType
 
 from . import async_get_device_config
-from .controller import get_controller
+from .controller import (
+    BROADLINK_CONTROLLER,
+    ENC_BASE64,
+    ENC_HEX,
+    ENC_PRONTO,
+    encode_broadlink_command,
+    get_controller,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +29,7 @@ CONF_UNIQUE_ID = "unique_id"
 CONF_DEVICE_CODE = "device_code"
 CONF_CONTROLLER_DATA = "controller_data"
 CONF_DELAY = "delay"
+CONF_FORCE_POWER_COMMANDS = "force_power_commands"
 
 SUPPORT_FLAGS = (
     RemoteEntityFeature.LEARN_COMMAND | RemoteEntityFeature.DELETE_COMMAND
@@ -35,6 +42,7 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
         vol.Required(CONF_DEVICE_CODE): cv.positive_int,
         vol.Required(CONF_CONTROLLER_DATA): cv.string,
         vol.Optional(CONF_DELAY, default=DEFAULT_DELAY): cv.positive_float,
+        vol.Optional(CONF_FORCE_POWER_COMMANDS, default=False): cv.boolean,
     }
 )
 
@@ -49,7 +57,7 @@ async def async_setup_platform(
     device_code = config.get(CONF_DEVICE_CODE)
 
     try:
-        device_data = await async_get_device_config("remote", device_code)
+        device_data = await async_get_device_config(hass, "remote", device_code)
     except Exception:
         _LOGGER.error("The device JSON file is invalid")
         return
@@ -57,6 +65,23 @@ async def async_setup_platform(
     async_add_entities([IRsinnRemote(hass, config, device_data)])
 
 
+def _preencode_commands(encoding, commands):
+    """Return ``commands`` converted to Broadlink Base64.
+
+    Commands that cannot be converted are logged and left out.
+    """
+    encoded = {}
+    for name, data in commands.items():
+        if data is None:
+            encoded[name] = data
+            continue
+        try:
+            encoded[name] = encode_broadlink_command(encoding, data)
+        except ValueError as exc:
+            _LOGGER.error("Unable to convert the %s command: %s", name, exc)
+    return encoded
+
+
 class IRsinnRemote(RemoteEntity, RestoreEntity):
     def __init__(self, hass, config, device_data):
         self.hass = hass
@@ -65,22 +90,51 @@ class IRsinnRemote(RemoteEntity, RestoreEntity):
         self._device_code = config.get(CONF_DEVICE_CODE)
         self._controller_data = config.get(CONF_CONTROLLER_DATA)
         self._delay = config.get(CONF_DELAY)
+        self._force_power_commands = config.get(CONF_FORCE_POWER_COMMANDS, False)
 
         self._manufacturer = device_data.get("manufacturer")
         self._supported_models = device_data.get("supportedModels")
         self._supported_controller = device_data.get("supportedController")
         self._commands_encoding = device_data.get("commandsEncoding")
         self._device_class = device_data.get("device_class")
-        self._commands = device_data.get("commands", {})
-
-        self._is_on = False
-        self._controller = get_controller(
-            hass,
-            self._supported_controller,
-            self._commands_encoding,
-            self._controller_data,
-            self._delay,
-        )
+        self._commands = dict(device_data.get("commands", {}))
+
+        # Broadlink sends Base64, so convert other encodings once up front
+        # instead of on every send.
+        self._controller_encoding = self._commands_encoding
+        if (
+            self._supported_controller == BROADLINK_CONTROLLER
+            and self._commands_encoding in (ENC_HEX, ENC_PRONTO)
+        ):
+            self._commands = _preencode_commands(
+                self._commands_encoding, self._commands
+            )
+            self._controller_encoding = ENC_BASE64
+
+        # ``None`` until the state is known, so the first power command is
+        # always sent.
+        self._is_on = None
+        self._controller = None
+
+    async def async_added_to_hass(self):
+        """Run when entity about to be added."""
+        await super().async_added_to_hass()
+
+        last_state = await self.async_get_last_state()
+        if last_state is not None and last_state.state in (STATE_ON, STATE_OFF):
+            self._is_on = last_state.state == STATE_ON
+
+    def _get_controller(self):
+        """Return the controller, creating it on first use."""
+        if self._controller is None:
+            self._controller = get_controller(
+                self.hass,
+                self._supported_controller,
+                self._controller_encoding,
+                self._controller_data,
+                self._delay,
+            )
+        return self._controller
 
     @property
     def name(self):
@@ -118,16 +172,20 @@ class IRsinnRemote(RemoteEntity, RestoreEntity):
         }
 
     async def async_turn_on(self, **kwargs):
+        if self._is_on and not self._force_power_commands:
+            return
         command = self._commands.get("turn_on")
         if command is not None:
-            await self._controller.send(command)
+            await self._get_controller().send(command)
         self._is_on = True
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
+        if self._is_on is False and not self._force_power_commands:
+            return
         command = self._commands.get("turn_off")
         if command is not None:
-            await self._controller.send(command)
+            await self._get_controller().send(command)
         self._is_on = False
         self.async_write_ha_state()
 
@@ -136,15 +194,24 @@ class IRsinnRemote(RemoteEntity, RestoreEntity):
             commands = [command]
         else:
             commands = command
-        for cmd in commands:
-            if cmd in self._commands:
-                await self._controller.send(self._commands[cmd])
-                await asyncio.sleep(self._delay)
+        payloads = [
+            payload
+            for payload in map(self._commands.get, commands)
+            if payload is not None
+        ]
+        if not payloads:
+            return
+
+        await self._get_controller().send_many(payloads)
 
     async def async_learn_command(self, **kwargs):
         command = kwargs.get("command")
         command_data = kwargs.get("command_data", [])
         if command:
+            if self._controller_encoding != self._commands_encoding:
+                command_data = encode_broadlink_command(
+                    self._commands_encoding, command_data
+                )
             self._commands[command] = command_data
 
     async def async_delete_command(self, **kwargs):
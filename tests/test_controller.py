@@ -0,0 +1,46 @@
+import types
+import pathlib
+import sys
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components"))
+from irsinn.controller import BroadlinkController
+
+
+PRONTO_B64 = "b64:JgAIAAABJpITAAxKDQUAAAAAAAAAAAAAAAAAAA=="
+
+
+class DummyServices:
+    def __init__(self):
+        self.calls = []
+
+    async def async_call(self, domain, service, service_data):
+        self.calls.append((domain, service, service_data))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pronto",
+    [
+        "0000006D00020000015500AA00160E3C",
+        "0000 006D 0002 0000 0155 00AA 0016 0E3C",
+        "0000\t006D\t0002\t0000\n0155 00AA\t0016 0E3C",
+    ],
+)
+async def test_broadlink_pronto_whitespace(pronto):
+    hass = types.SimpleNamespace(services=DummyServices())
+    controller = BroadlinkController(hass, "Broadlink", "Pronto", "remote.bl", 0)
+
+    await controller.send(pronto)
+
+    assert hass.services.calls == [
+        (
+            "remote",
+            "send_command",
+            {
+                "entity_id": "remote.bl",
+                "command": [PRONTO_B64],
+                "delay_secs": 0,
+            },
+        )
+    ]
@@ -0,0 +1,63 @@
+import asyncio
+import pathlib
+import sys
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components"))
+import irsinn
+
+
+class DummyHass:
+    def __init__(self):
+        self.jobs = []
+
+    async def async_add_executor_job(self, target, *args):
+        self.jobs.append(target)
+        # Yield so that concurrent callers overlap while the file is read.
+        await asyncio.sleep(0)
+        return target(*args)
+
+
+@pytest.fixture
+def codes_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(irsinn, "COMPONENT_ABS_DIR", str(tmp_path))
+    monkeypatch.setattr(irsinn, "_DEVICE_CONFIG_CACHE", {})
+    codes = tmp_path / "codes" / "remote"
+    codes.mkdir(parents=True)
+    return codes
+
+
+@pytest.mark.asyncio
+async def test_device_config_loaded_once(codes_dir):
+    (codes_dir / "1000.json").write_text('{"commands": {"turn_on": "on_cmd"}}')
+    hass = DummyHass()
+
+    results = await asyncio.gather(
+        *(irsinn.async_get_device_config(hass, "remote", 1000) for _ in range(5))
+    )
+
+    assert results[0] == {"commands": {"turn_on": "on_cmd"}}
+    assert all(result is results[0] for result in results)
+    assert len(hass.jobs) == 1
+
+    assert await irsinn.async_get_device_config(hass, "remote", 1000) is results[0]
+    assert len(hass.jobs) == 1
+
+
+@pytest.mark.asyncio
+async def test_device_config_failure_not_cached(monkeypatch, codes_dir):
+    async def failing_downloader(hass, source, dest):
+        raise FileNotFoundError(source)
+
+    monkeypatch.setattr(irsinn.Helper, "downloader", failing_downloader)
+    hass = DummyHass()
+
+    with pytest.raises(FileNotFoundError):
+        await irsinn.async_get_device_config(hass, "remote", 1000)
+    assert ("remote", 1000) not in irsinn._DEVICE_CONFIG_CACHE
+
+    # The next call retries the load instead of reusing the failure.
+    (codes_dir / "1000.json").write_text('{"commands": {}}')
+    assert await irsinn.async_get_device_config(hass, "remote", 1000) == {
+        "commands": {}
+    }
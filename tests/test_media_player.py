@@ -0,0 +1,43 @@
+import copy
+import types
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components"))
+from irsinn.media_player import IRsinnMediaPlayer
+
+
+def test_source_names_leave_device_data_untouched(monkeypatch):
+    hass = types.SimpleNamespace()
+    config = {
+        "name": "Test TV",
+        "device_code": 1000,
+        "controller_data": "dummy",
+        "delay": 0,
+        "source_names": {"HDMI1": "Console", "HDMI2": None},
+    }
+    device_data = {
+        "manufacturer": "Generic",
+        "supportedModels": ["Demo TV"],
+        "supportedController": "Broadlink",
+        "commandsEncoding": "Base64",
+        "commands": {
+            "off": "off_cmd",
+            "sources": {"HDMI1": "hdmi1_cmd", "HDMI2": "hdmi2_cmd", "TV": "tv_cmd"},
+        },
+    }
+    original = copy.deepcopy(device_data)
+
+    monkeypatch.setattr(
+        "irsinn.media_player.get_controller",
+        lambda *args, **kwargs: None,
+    )
+
+    entity = IRsinnMediaPlayer(hass, config, device_data)
+
+    assert entity.source_list == ["TV", "Console"]
+    assert device_data == original
+
+    # A second entity built from the same cached data sees the original names.
+    other = IRsinnMediaPlayer(hass, {**config, "source_names": {}}, device_data)
+    assert other.source_list == ["HDMI1", "HDMI2", "TV"]
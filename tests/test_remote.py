@@ -2,6 +2,8 @@ import types
 import pathlib
 import sys
 import pytest
+from homeassistant.core import State
+from homeassistant.helpers.restore_state import RestoreEntity
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components"))
 from irsinn.remote import IRsinnRemote
@@ -14,6 +16,9 @@ class DummyController:
     async def send(self, command):
         self.sent.append(command)
 
+    async def send_many(self, commands):
+        self.sent.extend(commands)
+
 
 @pytest.mark.asyncio
 async def test_send_and_power(monkeypatch):
@@ -55,3 +60,153 @@ async def test_send_and_power(monkeypatch):
 
     await entity.async_turn_off()
     assert not entity.is_on
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "force, expected",
+    [
+        (False, ["on_cmd", "off_cmd", "off_cmd"]),
+        (True, ["on_cmd", "on_cmd", "off_cmd", "off_cmd", "off_cmd"]),
+    ],
+)
+async def test_power_commands_skip_unchanged_state(monkeypatch, force, expected):
+    hass = types.SimpleNamespace()
+    config = {
+        "name": "Test Remote",
+        "device_code": 1000,
+        "controller_data": "dummy",
+        "delay": 0,
+        "force_power_commands": force,
+    }
+    device_data = {
+        "supportedController": "Broadlink",
+        "commandsEncoding": "Base64",
+        "commands": {"turn_on": "on_cmd", "turn_off": "off_cmd"},
+    }
+
+    dummy = DummyController()
+    monkeypatch.setattr(
+        "irsinn.remote.get_controller",
+        lambda *args, **kwargs: dummy,
+    )
+
+    entity = IRsinnRemote(hass, config, device_data)
+    entity.async_write_ha_state = lambda: None
+
+    await entity.async_turn_on()
+    await entity.async_turn_on()
+    await entity.async_turn_off()
+    await entity.async_turn_off()
+
+    # A fresh entity does not know the device state, so turn_off is sent.
+    fresh = IRsinnRemote(hass, config, device_data)
+    fresh.async_write_ha_state = lambda: None
+    await fresh.async_turn_off()
+
+    assert dummy.sent == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "encoding, good, bad",
+    [
+        ("Hex", "0a0b", "0g"),
+        (
+            "Pronto",
+            "0000 006D 0002 0000 0155 00AA 0016 0E3C",
+            "0000 0000 0001 0000 0010 0020",
+        ),
+        (
+            "Pronto",
+            "0000 006D 0002 0000 0155 00AA 0016 0E3C",
+            "0000 FFFF 0001 0000 FFFF FFFF",
+        ),
+    ],
+)
+async def test_commands_preencoded_for_broadlink(monkeypatch, encoding, good, bad):
+    hass = types.SimpleNamespace()
+    config = {
+        "name": "Test Remote",
+        "device_code": 1000,
+        "controller_data": "remote.bl",
+        "delay": 0,
+    }
+    device_data = {
+        "supportedController": "Broadlink",
+        "commandsEncoding": encoding,
+        "commands": {"good": good, "bad": bad},
+    }
+
+    dummy = DummyController()
+    created = []
+
+    def fake_get_controller(*args, **kwargs):
+        created.append(args)
+        return dummy
+
+    monkeypatch.setattr("irsinn.remote.get_controller", fake_get_controller)
+
+    entity = IRsinnRemote(hass, config, device_data)
+    await entity.async_send_command(["good"])
+
+    expected = {
+        "Hex": "Cgs=",
+        "Pronto": "JgAIAAABJpITAAxKDQUAAAAAAAAAAAAAAAAAAA==",
+    }[encoding]
+    assert "bad" not in entity._commands
+    assert dummy.sent == [expected]
+    assert created[0][2] == "Base64"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "last_state, is_on, expected",
+    [
+        (None, None, ["off_cmd"]),
+        ("on", True, ["off_cmd"]),
+        ("off", False, []),
+        ("unknown", None, ["off_cmd"]),
+        ("unavailable", None, ["off_cmd"]),
+    ],
+)
+async def test_power_state_restored(monkeypatch, last_state, is_on, expected):
+    hass = types.SimpleNamespace()
+    config = {
+        "name": "Test Remote",
+        "device_code": 1000,
+        "controller_data": "dummy",
+        "delay": 0,
+    }
+    device_data = {
+        "supportedController": "Broadlink",
+        "commandsEncoding": "Base64",
+        "commands": {"turn_on": "on_cmd", "turn_off": "off_cmd"},
+    }
+
+    dummy = DummyController()
+    monkeypatch.setattr(
+        "irsinn.remote.get_controller",
+        lambda *args, **kwargs: dummy,
+    )
+
+    async def added_to_hass(self):
+        pass
+
+    monkeypatch.setattr(RestoreEntity, "async_added_to_hass", added_to_hass)
+
+    entity = IRsinnRemote(hass, config, device_data)
+    entity.async_write_ha_state = lambda: None
+
+    async def get_last_state():
+        if last_state is None:
+            return None
+        return State("remote.test_remote", last_state)
+
+    entity.async_get_last_state = get_last_state
+
+    await entity.async_added_to_hass()
+    assert entity.is_on is is_on
+
+    await entity.async_turn_off()
+    assert dummy.sent == expected